@@ -7,13 +7,32 @@ from __future__ import annotations
 
 import asyncio
 
+from aiohttp import ClientError
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api import MyHarviaApi, MyHarviaDevice
-from .const import DOMAIN
-from .coordinator import MyHarviaDataUpdateCoordinator
+from .api import (
+    MyHarviaApi,
+    MyHarviaApiClientError,
+    MyHarviaAuthenticationFailed,
+    MyHarviaDevice,
+    MyHarviaServiceDescriptionFailure,
+)
+from .const import (
+    CONF_DEVICES,
+    CONF_SERVICE_CONFIG,
+    CONF_TOKENS,
+    DOMAIN,
+    LOGGER,
+)
+from .coordinator import (
+    MyHarviaData,
+    MyHarviaDataUpdateCoordinator,
+    MyHarviaStore,
+)
 
 
 PLATFORMS: list[Platform] = [
@@ -32,27 +51,146 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         username=entry.data[CONF_USERNAME],
         password=entry.data[CONF_PASSWORD],
         hass=hass,
+        session=async_get_clientsession(hass),
+        config=entry.data.get(CONF_SERVICE_CONFIG),
+        tokens=entry.data.get(CONF_TOKENS),
     )
 
-    await client.async_init()
+    cached_device_ids = entry.data.get(CONF_DEVICES)
+    try:
+        data = await _async_setup_devices(hass, entry, client)
+    except MyHarviaAuthenticationFailed as exception:
+        raise ConfigEntryAuthFailed(exception) from exception
+    except (
+        MyHarviaApiClientError,
+        MyHarviaServiceDescriptionFailure,
+        ClientError,
+        asyncio.TimeoutError,
+    ) as exception:
+        _async_drop_cache(hass, entry)
+        raise ConfigEntryNotReady(exception) from exception
 
-    devices: list[MyHarviaDevice] = await client.get_devices()
+    hass.data[DOMAIN][entry.entry_id] = data
 
-    device_coordinators: list[MyHarviaDataUpdateCoordinator] = []
-    for device in devices:
-        device = MyHarviaDevice(client, device)
-        await device.async_init()
-        device_coordinator = MyHarviaDataUpdateCoordinator(hass, device)
-        device_coordinators.append(device_coordinator)
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = device_coordinators
+    if cached_device_ids is not None:
+        # Set up from the cached device list, look for added or removed devices
+        device_check = hass.async_create_task(
+            _async_check_devices(hass, entry, client, cached_device_ids)
+        )
+        entry.async_on_unload(device_check.cancel)
 
-    await asyncio.gather(
-        *[
-            coordinator.async_config_entry_first_refresh()
-            for coordinator in device_coordinators
-        ]
-    )
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    return True
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
+
+    data: MyHarviaData = hass.data[DOMAIN].pop(entry.entry_id)
+
+    for coordinator in data.coordinators:
+        await coordinator.async_shutdown()
+    await data.store.async_save()
+    # Tokens may have been refreshed while polling, keep them for the reload
+    _async_store_session(hass, entry, data.client)
 
     return True
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the learned heat-up curves and pre-heats of a deleted entry."""
+    await MyHarviaStore(hass, entry.entry_id).async_remove()
+
+
+async def _async_setup_devices(
+    hass: HomeAssistant, entry: ConfigEntry, client: MyHarviaApi
+) -> MyHarviaData:
+    """Authenticate, discover devices and fetch their state."""
+    await client.async_init()
+
+    device_ids: list[str] = entry.data.get(CONF_DEVICES)
+    if device_ids is None:
+        device_ids = await client.get_devices()
+    _async_store_session(hass, entry, client, device_ids)
+
+    devices: list[MyHarviaDevice] = [
+        MyHarviaDevice(client, device_id) for device_id in device_ids
+    ]
+    await asyncio.gather(*[device.async_init() for device in devices])
+
+    store = MyHarviaStore(hass, entry.entry_id)
+    stored: dict = await store.async_load()
+
+    store.coordinators = [
+        MyHarviaDataUpdateCoordinator(
+            hass, device, store, stored.get(device.device_id)
+        )
+        for device in devices
+    ]
+
+    # async_init just fetched the state and data, no need for a first refresh
+    for coordinator in store.coordinators:
+        coordinator.async_set_initial_data()
+
+    return MyHarviaData(client, store.coordinators, store)
+
+
+async def _async_check_devices(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    client: MyHarviaApi,
+    cached_device_ids: list[str],
+) -> None:
+    """Reload the entry if the account's devices changed since they were cached."""
+    try:
+        device_ids = await client.get_devices()
+    except (
+        MyHarviaApiClientError,
+        MyHarviaAuthenticationFailed,
+        ClientError,
+        asyncio.TimeoutError,
+    ) as exception:
+        LOGGER.debug("Failed to check for device changes: %s", exception)
+        return
+    if set(device_ids) != set(cached_device_ids):
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_DEVICES: device_ids}
+        )
+        # Not awaited, unloading the entry cancels this task
+        hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+
+
+@callback
+def _async_store_session(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    client: MyHarviaApi,
+    device_ids: list[str] | None = None,
+) -> None:
+    """Keep the current tokens, discovered services and devices for the next setup."""
+    data = {
+        **entry.data,
+        CONF_SERVICE_CONFIG: client.config,
+        CONF_TOKENS: client.tokens,
+    }
+    if device_ids is not None:
+        data[CONF_DEVICES] = device_ids
+    if data != entry.data:
+        hass.config_entries.async_update_entry(entry, data=data)
+
+
+@callback
+def _async_drop_cache(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the stored services and devices, Harvia may have moved an endpoint."""
+    if CONF_SERVICE_CONFIG in entry.data or CONF_DEVICES in entry.data:
+        hass.config_entries.async_update_entry(
+            entry,
+            data={
+                key: value
+                for key, value in entry.data.items()
+                if key not in (CONF_SERVICE_CONFIG, CONF_DEVICES)
+            },
+        )
@@ -3,12 +3,27 @@ from __future__ import annotations
 
 import json
 import aiohttp
+import requests
+from botocore.exceptions import BotoCoreError, ClientError
+from jose import JWTError
 from pycognito import Cognito
 from pycognito.exceptions import WarrantException
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import LOGGER
 
+# Service description keys mapped to their discovery endpoint names
+SERVICES = {
+    "user": "users",
+    "device": "device",
+    "data": "data",
+    "events": "events",
+}
+
+# Cognito error codes meaning the username or password was rejected
+AUTH_ERROR_CODES = ("NotAuthorizedException", "UserNotFoundException")
+
 
 class MyHarviaAuthenticationFailed(Exception):
     """Authentication Exception."""
@@ -29,28 +44,58 @@ class MyHarviaApi:
         self,
         username: str = None,
         password: str = None,
-        token_file="myharvia_token.json",
         hass: HomeAssistant = None,
         session=None,
+        config: dict | None = None,
+        tokens: dict | None = None,
     ):
-        """Create MyHarviaAPI Client."""
+        """Create MyHarviaAPI Client.
+
+        ``config`` and ``tokens`` may be given from a previous session (e.g. the
+        config flow) to skip service discovery and the Cognito handshake.
+        """
         self.username = username
         self.password = password
-        self.token_file = token_file
         self.hass = hass
         self.session = session
         self.cognito = None
         self.headers = None
-        self.config: dict = {}
+        self.config: dict = dict(config or {})
+        self._stored_tokens = tokens
+
+    @property
+    def tokens(self) -> dict | None:
+        """Return the current Cognito tokens, if authenticated."""
+        if self.cognito is None or self.cognito.id_token is None:
+            return None
+        return {
+            "access_token": self.cognito.access_token,
+            "id_token": self.cognito.id_token,
+            "refresh_token": self.cognito.refresh_token,
+        }
 
     async def async_init(self) -> None:
         """Async init, retrieve and store service description, authenticate."""
-        self.config["user"] = await self._get_harvia_config("users")
-        self.config["device"] = await self._get_harvia_config("device")
-        self.config["data"] = await self._get_harvia_config("data")
-        self.config["events"] = await self._get_harvia_config("events")
+        await self.async_discover()
         await self.authenticate()
 
+    async def async_discover(self) -> None:
+        """Retrieve the service descriptions not already known."""
+        for key, service in SERVICES.items():
+            if key not in self.config:
+                self.config[key] = await self._get_harvia_config(service)
+
+    async def async_validate(self) -> None:
+        """Validate the credentials with a single password authentication.
+
+        Stored tokens are ignored so that only the given username and password
+        are checked.
+        """
+        await self.async_discover()
+        await self.hass.async_add_executor_job(self._blocked_cognito_auth)
+        await self._authenticate_with_pass()
+        self._set_headers()
+
     def _blocked_cognito_auth(self) -> None:
         self.cognito = Cognito(
             self.config["user"]["userPoolId"],
@@ -65,17 +110,19 @@ class MyHarviaApi:
                 self.cognito.authenticate, self.password
             )
             # self.cognito.authenticate(self.password)
-        except Exception as exc:
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in AUTH_ERROR_CODES:
+                raise MyHarviaAuthenticationFailed(
+                    "Failed to authenticate with the provided username and password."
+                ) from exc
+            raise MyHarviaApiClientError(f"Authentication request failed: {exc}") from exc
+        except WarrantException as exc:
+            # Password change, MFA challenge or an unverifiable token
             raise MyHarviaAuthenticationFailed(
-                "Failed to authenticate with the provided username and password."
+                f"Failed to authenticate with the provided username and password: {exc}"
             ) from exc
-        access_token_data = {
-            "access_token": self.cognito.access_token,
-            "id_token": self.cognito.id_token,
-            "refresh_token": self.cognito.refresh_token,
-        }
-        with open(self.token_file, "w", encoding="utf-8") as file:
-            json.dump(access_token_data, file)
+        except (BotoCoreError, requests.RequestException) as exc:
+            raise MyHarviaApiClientError(f"Authentication request failed: {exc}") from exc
         LOGGER.debug("Authentication successful using username and password.")
 
     async def authenticate(self) -> None:
@@ -83,31 +130,53 @@ class MyHarviaApi:
         if self.cognito is not None:
             try:
                 await self.hass.async_add_executor_job(self.cognito.check_token)
-            except WarrantException:
+            except (WarrantException, ClientError, JWTError):
                 await self._authenticate_with_pass()
+            except (BotoCoreError, requests.RequestException) as exc:
+                raise MyHarviaApiClientError(f"Token renewal failed: {exc}") from exc
         else:
             LOGGER.debug("Entering _blocked_auth")
             await self.hass.async_add_executor_job(self._blocked_cognito_auth)
             LOGGER.debug("done _blocked_auth: %s", self.cognito)
 
-            # Try to load access token, user_pool_id, and client_id from file
-            try:
-                with open(self.token_file, encoding="utf-8") as file:
-                    access_token_data = json.load(file)
-                    self.cognito.access_token = access_token_data["access_token"]
-                    self.cognito.id_token = access_token_data["id_token"]
-                    self.cognito.refresh_token = access_token_data["refresh_token"]
-                    await self.hass.async_add_executor_job(self.cognito.check_token)
-                    # self.cognito.check_token()
-                LOGGER.debug("Authentication successful using stored tokens.")
-            except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError):
+            # Try the tokens handed over by the caller before the password
+            if self._stored_tokens is None:
                 await self._authenticate_with_pass()
+            else:
+                try:
+                    self.cognito.access_token = self._stored_tokens["access_token"]
+                    self.cognito.id_token = self._stored_tokens["id_token"]
+                    self.cognito.refresh_token = self._stored_tokens["refresh_token"]
+                    await self.hass.async_add_executor_job(self.cognito.check_token)
+                    LOGGER.debug("Authentication successful using stored tokens.")
+                except (
+                    KeyError,
+                    ValueError,
+                    WarrantException,
+                    ClientError,
+                    JWTError,
+                ):
+                    # Expired, revoked or malformed tokens
+                    await self._authenticate_with_pass()
+                except (BotoCoreError, requests.RequestException) as exc:
+                    raise MyHarviaApiClientError(
+                        f"Token renewal failed: {exc}"
+                    ) from exc
+
+        self._set_headers()
 
+    def _set_headers(self) -> None:
         self.headers = {
             "Authorization": f"Bearer {self.cognito.id_token}",
             "Content-Type": "application/json",
         }
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session, the shared Home Assistant one by default."""
+        if self.session is None:
+            self.session = async_get_clientsession(self.hass)
+        return self.session
+
     async def get_config_device(self) -> dict:
         """Return config service description."""
         return self.config["device"]
@@ -118,28 +187,28 @@ class MyHarviaApi:
 
     async def _get_harvia_config(self, service) -> dict:
         url = f"https://prod.myharvia-cloud.net/{service}/endpoint"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    config_data = await response.json()
-                    return config_data
-                else:
-                    raise MyHarviaServiceDescriptionFailure(
-                        f"Failed to get configuration data. Status code: {response.status}"
-                    )
+        async with self._get_session().get(url) as response:
+            if response.status == 200:
+                config_data = await response.json()
+                return config_data
+            else:
+                raise MyHarviaServiceDescriptionFailure(
+                    f"Failed to get configuration data. Status code: {response.status}"
+                )
 
     async def send_request(self, api_base_url, data, retry=True):
         """Post request to api and return results as a dict."""
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            async with session.post(api_base_url, json=data) as response:
-                if response.status == 401 and retry:  # Token expired
-                    await self.authenticate()
-                    return await self.send_request(api_base_url, data, retry=False)
-                if response.status not in (200, 201):
-                    raise MyHarviaApiClientError(
-                        f"API request failed with status code {response.status}: {response.text}"
-                    )
-                return await response.json()
+        async with self._get_session().post(
+            api_base_url, json=data, headers=self.headers
+        ) as response:
+            if response.status == 401 and retry:  # Token expired
+                await self.authenticate()
+                return await self.send_request(api_base_url, data, retry=False)
+            if response.status not in (200, 201):
+                raise MyHarviaApiClientError(
+                    f"API request failed with status code {response.status}: {response.text}"
+                )
+            return await response.json()
 
     async def get_devices(self):
         """Return a list of Devices."""
@@ -151,7 +220,6 @@ class MyHarviaApi:
             }
             """,
         }
-        await self.async_init()
         LOGGER.debug("config_device: %s", self.config["device"])
         response = await self.send_request(self.config["device"]["endpoint"], data)
         device_tree = json.loads(response["data"]["getDeviceTree"])
@@ -196,6 +264,10 @@ class MyHarviaDevice:
         """Return value from self data.getLatestData.data.key."""
         return self.data["getLatestData"]["data"][key]
 
+    def get_latest_timestamp(self):
+        """Return self data.getLatestData.timestamp."""
+        return self.data["getLatestData"]["timestamp"]
+
     def get_reported_state(self, key: str):
         """Return value from self state.getDeviceState.reported.key."""
         return self.state["getDeviceState"]["reported"][key]
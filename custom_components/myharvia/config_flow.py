@@ -1,13 +1,23 @@
 """Adds config flow for MyHarvia component."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Mapping
 from typing import Any, Optional
+from aiohttp import ClientError
 from homeassistant import config_entries
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import voluptuous as vol
-from .api import MyHarviaApi, MyHarviaApiClientError
+from .api import (
+    MyHarviaApi,
+    MyHarviaApiClientError,
+    MyHarviaAuthenticationFailed,
+    MyHarviaServiceDescriptionFailure,
+)
 
-from .const import DOMAIN, LOGGER
+from .const import CONF_SERVICE_CONFIG, CONF_TOKENS, DOMAIN, LOGGER
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -18,6 +28,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_CLOUD_POLL
 
+    _entry: config_entries.ConfigEntry | None = None
+
     async def async_step_user(
         self, user_input: Optional[dict[str, Any]] = None
     ) -> FlowResult:
@@ -25,21 +37,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if user_input is not None:
-            try:
-                harvia_service = MyHarviaApi(
-                    username=user_input["username"],
-                    password=user_input["password"],
-                )
-
-                await self.async_set_unique_id(harvia_service.username)
-                self._abort_if_unique_id_configured()
+            await self.async_set_unique_id(user_input[CONF_USERNAME])
+            self._abort_if_unique_id_configured()
 
+            data, errors = await self._async_validate_input(user_input)
+            if not errors:
                 return self.async_create_entry(
-                    title=user_input["username"], data=user_input
+                    title=user_input[CONF_USERNAME], data=data
                 )
-            except MyHarviaApiClientError as exc:
-                LOGGER.error("Failed to connect to Harvia service: %s", exc)
-                errors["base"] = "cannot_connect"
 
         return self.async_show_form(
             step_id="user",
@@ -47,11 +52,85 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_reauth(self, entry_data: Mapping[str, Any]) -> FlowResult:
+        """Handle re-authentication after the stored credentials were rejected."""
+        self._entry = self.hass.config_entries.async_get_entry(
+            self.context["entry_id"]
+        )
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(
+        self, user_input: Optional[dict[str, Any]] = None
+    ) -> FlowResult:
+        """Ask for a new password for the existing account."""
+        errors = {}
+
+        if user_input is not None:
+            data, errors = await self._async_validate_input(
+                {**self._entry.data, **user_input}
+            )
+            if not errors:
+                return await self._async_update_entry(data, "reauth_successful")
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=vol.Schema({vol.Required(CONF_PASSWORD): str}),
+            description_placeholders={CONF_USERNAME: self._entry.data[CONF_USERNAME]},
+            errors=errors,
+        )
+
+    async def _async_validate_input(
+        self, user_input: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """Authenticate once and return the entry data or the form errors.
+
+        The discovered service description and tokens are stored with the entry
+        so that setup does not repeat discovery and the Cognito handshake.
+        """
+        harvia_service = MyHarviaApi(
+            username=user_input[CONF_USERNAME],
+            password=user_input[CONF_PASSWORD],
+            hass=self.hass,
+            session=async_get_clientsession(self.hass),
+        )
+        try:
+            await harvia_service.async_validate()
+        except MyHarviaAuthenticationFailed as exc:
+            LOGGER.warning("Invalid credentials for Harvia service: %s", exc)
+            return {}, {"base": "auth"}
+        except (
+            MyHarviaApiClientError,
+            MyHarviaServiceDescriptionFailure,
+            ClientError,
+            asyncio.TimeoutError,
+        ) as exc:
+            LOGGER.error("Failed to connect to Harvia service: %s", exc)
+            return {}, {"base": "connection"}
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception("Unexpected error while validating Harvia credentials")
+            return {}, {"base": "unknown"}
+
+        return {
+            CONF_USERNAME: user_input[CONF_USERNAME],
+            CONF_PASSWORD: user_input[CONF_PASSWORD],
+            CONF_SERVICE_CONFIG: harvia_service.config,
+            CONF_TOKENS: harvia_service.tokens,
+        }, {}
+
+    async def _async_update_entry(self, data: dict[str, Any], reason: str) -> FlowResult:
+        """Store the new data on the existing entry, reload it and abort."""
+        self.hass.config_entries.async_update_entry(
+            self._entry,
+            data=data,
+        )
+        await self.hass.config_entries.async_reload(self._entry.entry_id)
+        return self.async_abort(reason=reason)
+
     @staticmethod
     def _get_user_schema() -> vol.Schema:
         return vol.Schema(
             {
-                vol.Required("username"): str,
-                vol.Required("password"): str,
+                vol.Required(CONF_USERNAME): str,
+                vol.Required(CONF_PASSWORD): str,
             }
         )
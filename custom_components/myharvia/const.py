@@ -7,3 +7,18 @@ NAME = "MyHarvia"
 DOMAIN = "myharvia"
 VERSION = "0.0.1"
 ATTRIBUTION = "Data provided by myharvia-cloud.net"
+
+# Config entry keys for state handed over from the config flow
+CONF_DEVICES = "devices"
+CONF_SERVICE_CONFIG = "service_config"
+CONF_TOKENS = "tokens"
+
+# Heat-up model and pre-heat planner
+DEFAULT_HEAT_UP_RATE = 1.0  # °C per minute, used until the model is trained
+HEATUP_SAVE_DELAY = 60
+PREHEAT_RETRY_DELAY = 60
+HEATUP_STORAGE_VERSION = 1
+ATTR_READY_AT = "ready_at"
+ATTR_TARGET_TEMPERATURE = "target_temperature"
+SERVICE_CANCEL_PREHEAT = "cancel_preheat"
+SERVICE_SCHEDULE_PREHEAT = "schedule_preheat"
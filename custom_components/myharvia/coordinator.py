@@ -1,22 +1,40 @@
 """DataUpdateCoordinator for MyHarvia component."""
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 
+from aiohttp import ClientError
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_point_in_utc_time,
+)
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.util import dt as dt_util
 
 from .api import (
+    MyHarviaApi,
     MyHarviaDevice,
     MyHarviaAuthenticationFailed,
     MyHarviaApiClientError,
 )
-from .const import DOMAIN, LOGGER
+from .const import (
+    DEFAULT_HEAT_UP_RATE,
+    DOMAIN,
+    HEATUP_SAVE_DELAY,
+    HEATUP_STORAGE_VERSION,
+    LOGGER,
+    PREHEAT_RETRY_DELAY,
+)
+from .heatup import HeatUpModel
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
@@ -29,9 +47,23 @@ class MyHarviaDataUpdateCoordinator(DataUpdateCoordinator):
         self,
         hass: HomeAssistant,
         device: MyHarviaDevice,
+        store: MyHarviaStore,
+        state: dict | None = None,
     ) -> None:
-        """Initialize."""
+        """Initialize, restoring the heat-up model and pre-heat from state."""
+        state = state or {}
         self.device = device
+        self.store = store
+        self.heatup = HeatUpModel(state=state.get("heatup"))
+        self.ready_time: datetime | None = None
+        self._preheat: tuple[datetime, float | None] | None = None
+        self._unsub_preheat: CALLBACK_TYPE | None = None
+        self._preheat_starting = False
+        if preheat := state.get("preheat"):
+            self._preheat = (
+                dt_util.parse_datetime(preheat["ready_at"]),
+                preheat["target"],
+            )
         super().__init__(
             hass=hass,
             logger=LOGGER,
@@ -39,12 +71,226 @@ class MyHarviaDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(minutes=5),
         )
 
+    def as_dict(self) -> dict:
+        """Return the state to persist, restored with ``state``."""
+        preheat = None
+        if self._preheat is not None:
+            ready_at, target = self._preheat
+            preheat = {"ready_at": ready_at.isoformat(), "target": target}
+        return {"heatup": self.heatup.as_dict(), "preheat": preheat}
+
+    async def async_shutdown(self) -> None:
+        """Cancel the scheduled pre-heat timer and refreshes."""
+        self._async_unsub_preheat()
+        await super().async_shutdown()
+
+    @callback
+    def async_set_initial_data(self) -> None:
+        """Use the state and data fetched by MyHarviaDevice.async_init."""
+        self._async_process_data()
+        self.async_set_updated_data({})
+
     async def _async_update_data(self):
         """Update data via library."""
         try:
             await self.device.async_update()
-            return {}
         except MyHarviaAuthenticationFailed as exception:
             raise ConfigEntryAuthFailed(exception) from exception
         except MyHarviaApiClientError as exception:
             raise UpdateFailed(exception) from exception
+
+        self._async_process_data()
+        return {}
+
+    @callback
+    def _async_process_data(self) -> None:
+        """Learn from the latest sample and re-plan a pending pre-heat."""
+        self._async_update_heatup()
+        # While the heater is being turned on the start time is in the past,
+        # re-planning would send a second request
+        if self._preheat is not None and not self._preheat_starting:
+            self._async_plan_preheat()
+        self.store.async_schedule_save()
+
+    @callback
+    def _async_update_heatup(self) -> None:
+        """Learn from the latest sample and update the estimated ready time."""
+        timestamp = _sample_timestamp(self.device.get_latest_timestamp())
+        temperature = self.device.get_latest_data("temperature")
+        target = self.device.get_reported_state("targetTemp")
+        heating = bool(self.device.get_reported_state("active"))
+        if timestamp is None:
+            LOGGER.debug(
+                "Unknown sample timestamp: %s", self.device.get_latest_timestamp()
+            )
+            return
+        self.heatup.add_sample(timestamp, temperature, target, heating)
+
+        sampled_at = dt_util.utc_from_timestamp(timestamp)
+        minutes = self.heatup.minutes_to(temperature, target) if heating else None
+        if minutes is None:
+            self.ready_time = None
+        elif minutes > 0:
+            self.ready_time = sampled_at + timedelta(minutes=minutes)
+        elif self.ready_time is None or self.ready_time > sampled_at:
+            self.ready_time = sampled_at
+
+    @callback
+    def async_schedule_preheat(
+        self, ready_at: datetime, target: float | None = None
+    ) -> None:
+        """Turn the heater on in time to reach the target at ready_at."""
+        self._async_unsub_preheat()
+        self._preheat = (dt_util.as_utc(ready_at), target)
+        if self._async_plan_preheat() < dt_util.utcnow():
+            LOGGER.warning(
+                "Not enough time to heat %s by %s, starting now",
+                self.device.device_id,
+                ready_at,
+            )
+        self.store.async_schedule_save()
+
+    @callback
+    def async_cancel_preheat(self) -> None:
+        """Cancel a scheduled pre-heat."""
+        self._async_unsub_preheat()
+        self._preheat = None
+        self.store.async_schedule_save()
+
+    @callback
+    def _async_unsub_preheat(self) -> None:
+        """Cancel the pre-heat timer, keeping the pre-heat itself."""
+        if self._unsub_preheat is not None:
+            self._unsub_preheat()
+            self._unsub_preheat = None
+
+    @callback
+    def _async_plan_preheat(self) -> datetime:
+        """(Re)compute the heater start time from the current temperature."""
+        ready_at, target = self._preheat
+        now = dt_util.utcnow()
+        if ready_at <= now:
+            # Home Assistant was not running when it should have started
+            LOGGER.warning(
+                "Dropping pre-heat of %s for %s, it is in the past",
+                self.device.device_id,
+                ready_at,
+            )
+            self.async_cancel_preheat()
+            return ready_at
+
+        if target is None:
+            target = self.device.get_reported_state("targetTemp")
+        temperature = self.device.get_latest_data("temperature")
+
+        minutes = self.heatup.minutes_to(temperature, target)
+        if minutes is None:
+            ready = self.heatup.ready_temperature(target)
+            minutes = max(ready - temperature, 0) / DEFAULT_HEAT_UP_RATE
+        start = ready_at - timedelta(minutes=minutes)
+        LOGGER.debug(
+            "Pre-heat of %s to %s°C for %s starts at %s",
+            self.device.device_id,
+            target,
+            ready_at,
+            start,
+        )
+
+        self._async_unsub_preheat()
+        self._unsub_preheat = async_track_point_in_utc_time(
+            self.hass, self._async_start_preheat, max(start, now)
+        )
+        return start
+
+    async def _async_start_preheat(self, _now: datetime) -> None:
+        """Turn the heater on for a scheduled pre-heat, retrying on errors."""
+        self._unsub_preheat = None
+        ready_at, target = self._preheat
+
+        state_data: dict = {"active": 1}
+        if target is not None:
+            state_data["targetTemp"] = target
+        self._preheat_starting = True
+        try:
+            await self.device.async_request_state_change(state_data)
+        except (
+            MyHarviaApiClientError,
+            MyHarviaAuthenticationFailed,
+            ClientError,
+            asyncio.TimeoutError,
+        ) as exception:
+            self._preheat_starting = False
+            retry_at = dt_util.utcnow() + timedelta(seconds=PREHEAT_RETRY_DELAY)
+            if retry_at >= ready_at:
+                LOGGER.error(
+                    "Failed to start pre-heat of %s, giving up: %s",
+                    self.device.device_id,
+                    exception,
+                )
+                self.async_cancel_preheat()
+                return
+            LOGGER.warning(
+                "Failed to start pre-heat of %s, retrying: %s",
+                self.device.device_id,
+                exception,
+            )
+            self._unsub_preheat = async_call_later(
+                self.hass, PREHEAT_RETRY_DELAY, self._async_start_preheat
+            )
+            return
+
+        self._preheat_starting = False
+        self.async_cancel_preheat()
+        await self.async_request_refresh()
+
+
+class MyHarviaStore:
+    """Persist the heat-up models and pending pre-heats of a config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize."""
+        self._store = Store(hass, HEATUP_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.heatup")
+        self.coordinators: list[MyHarviaDataUpdateCoordinator] = []
+
+    async def async_load(self) -> dict:
+        """Return the stored state by device id."""
+        return await self._store.async_load() or {}
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the state after a delay."""
+        self._store.async_delay_save(self._data, HEATUP_SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Save the state now, cancelling a delayed save."""
+        await self._store.async_save(self._data())
+
+    async def async_remove(self) -> None:
+        """Remove the stored state."""
+        await self._store.async_remove()
+
+    def _data(self) -> dict:
+        return {
+            coordinator.device.device_id: coordinator.as_dict()
+            for coordinator in self.coordinators
+        }
+
+
+@dataclass
+class MyHarviaData:
+    """Runtime data of a MyHarvia config entry."""
+
+    client: MyHarviaApi
+    coordinators: list[MyHarviaDataUpdateCoordinator]
+    store: MyHarviaStore
+
+
+def _sample_timestamp(value) -> float | None:
+    """Return a getLatestData timestamp in seconds since the epoch."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        parsed = dt_util.parse_datetime(value) if isinstance(value, str) else None
+        return parsed.timestamp() if parsed else None
+    # Milliseconds, as used by the Harvia cloud
+    return number / 1000 if number > 1e11 else number
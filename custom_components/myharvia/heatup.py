@@ -0,0 +1,138 @@
+"""Heat-up model for MyHarvia saunas."""
+from __future__ import annotations
+
+import math
+
+# Samples further apart than this are not used, the curve between them is unknown
+MAX_SAMPLE_GAP = 30 * 60
+# Samples closer than this are too noisy, wait for the next one
+MIN_SAMPLE_GAP = 60
+MIN_SAMPLES = 3
+
+
+class HeatUpModel:
+    """Learn the heat-up curve of a sauna from temperature samples.
+
+    The heating rate r (°C/min) is modelled as a linear function of the
+    cabin temperature T, r = a + b * T, which gives the usual exponential
+    approach to the heater's maximum temperature. The fit is an exponentially
+    weighted least squares kept as running sums, so each sample and each
+    prediction costs constant time and no history is stored.
+    """
+
+    def __init__(
+        self,
+        forgetting: float = 0.98,
+        margin: float = 2.0,
+        state: dict | None = None,
+    ) -> None:
+        """Create HeatUpModel, optionally restoring a previous state."""
+        self.forgetting = forgetting
+        self.margin = margin
+        self._last: tuple[float, float] | None = None
+        self._count = 0
+        self._weight = 0.0
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._sum_xx = 0.0
+        self._sum_xy = 0.0
+        if state:
+            self._count = state["count"]
+            self._weight = state["weight"]
+            self._sum_x = state["sum_x"]
+            self._sum_y = state["sum_y"]
+            self._sum_xx = state["sum_xx"]
+            self._sum_xy = state["sum_xy"]
+
+    def as_dict(self) -> dict:
+        """Return the learned state, to be restored with ``state``."""
+        return {
+            "count": self._count,
+            "weight": self._weight,
+            "sum_x": self._sum_x,
+            "sum_y": self._sum_y,
+            "sum_xx": self._sum_xx,
+            "sum_xy": self._sum_xy,
+        }
+
+    @property
+    def trained(self) -> bool:
+        """Return True once enough heat-up samples were seen."""
+        return self._count >= MIN_SAMPLES
+
+    def add_sample(
+        self, timestamp: float, temperature: float, target: float, heating: bool
+    ) -> None:
+        """Add a temperature sample, timestamp in seconds.
+
+        Only samples taken while the heater is on and the cabin is still below
+        the target are learned, once the thermostat holds the temperature the
+        rate says nothing about the heater.
+        """
+        if self._last is not None and timestamp <= self._last[0]:
+            # The same sample was returned again
+            return
+        if not heating or temperature >= self.ready_temperature(target):
+            self._last = None
+            return
+        if self._last is None:
+            self._last = (timestamp, temperature)
+            return
+
+        last_timestamp, last_temperature = self._last
+        elapsed = timestamp - last_timestamp
+        if elapsed < MIN_SAMPLE_GAP:
+            return
+        self._last = (timestamp, temperature)
+        if elapsed > MAX_SAMPLE_GAP:
+            return
+
+        rate = (temperature - last_temperature) / (elapsed / 60)
+        if rate <= 0:
+            return
+        self._fit((temperature + last_temperature) / 2, rate)
+
+    def _fit(self, x: float, y: float) -> None:
+        """Add one point to the weighted least squares sums."""
+        decay = self.forgetting
+        self._count += 1
+        self._weight = self._weight * decay + 1
+        self._sum_x = self._sum_x * decay + x
+        self._sum_y = self._sum_y * decay + y
+        self._sum_xx = self._sum_xx * decay + x * x
+        self._sum_xy = self._sum_xy * decay + x * y
+
+    def _coefficients(self) -> tuple[float, float]:
+        """Return (a, b) of the fitted rate r = a + b * T."""
+        denominator = self._weight * self._sum_xx - self._sum_x**2
+        if abs(denominator) < 1e-9:
+            return self._sum_y / self._weight, 0.0
+        slope = (self._weight * self._sum_xy - self._sum_x * self._sum_y) / denominator
+        return (self._sum_y - slope * self._sum_x) / self._weight, slope
+
+    def ready_temperature(self, target: float) -> float:
+        """Return the temperature at which a sauna heating to target is ready."""
+        return target - self.margin
+
+    def minutes_to(self, temperature: float, target: float) -> float | None:
+        """Return the minutes needed to heat from temperature until ready.
+
+        The sauna is ready ``margin`` below target, see ready_temperature.
+        Return None while the model is not trained yet.
+        """
+        if not self.trained:
+            return None
+        ready = self.ready_temperature(target)
+        if temperature >= ready:
+            return 0.0
+
+        intercept, slope = self._coefficients()
+        start_rate = intercept + slope * temperature
+        end_rate = intercept + slope * ready
+        if start_rate <= 0 or end_rate <= 0:
+            # Extrapolated past the fitted curve, fall back to the mean rate
+            mean_rate = self._sum_y / self._weight
+            return (ready - temperature) / mean_rate
+        if abs(slope) < 1e-6:
+            return (ready - temperature) / start_rate
+        return math.log(end_rate / start_rate) / slope
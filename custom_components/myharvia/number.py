@@ -36,7 +36,7 @@ async def async_setup_entry(
     """Set up the number platform."""
     async_add_entities(
         MyHarviaNumber(coordinator=coordinator, entity_description=entity_description)
-        for coordinator in hass.data[DOMAIN][entry.entry_id]
+        for coordinator in hass.data[DOMAIN][entry.entry_id].coordinators
         for entity_description in ENTITY_DESCRIPTIONS
     )
 
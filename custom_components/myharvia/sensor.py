@@ -62,15 +62,30 @@ ENTITY_DESCRIPTIONS: tuple[MyHarviaSensorEntityDescription, ...] = (
 )
 
 
+READY_TIME_ENTITY_DESCRIPTION = SensorEntityDescription(
+    key="ready_time",
+    name="Estimated Ready Time",
+    device_class=SensorDeviceClass.TIMESTAMP,
+    icon="mdi:timer-sand",
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the sensor platform."""
     async_add_entities(
         MyHarviaSensor(coordinator=coordinator, entity_description=entity_description)
-        for coordinator in hass.data[DOMAIN][entry.entry_id]
+        for coordinator in hass.data[DOMAIN][entry.entry_id].coordinators
         for entity_description in ENTITY_DESCRIPTIONS
     )
+    async_add_entities(
+        MyHarviaReadyTimeSensor(
+            coordinator=coordinator,
+            entity_description=READY_TIME_ENTITY_DESCRIPTION,
+        )
+        for coordinator in hass.data[DOMAIN][entry.entry_id].coordinators
+    )
 
 
 class MyHarviaSensor(MyHarviaEntity, SensorEntity):
@@ -84,3 +99,12 @@ class MyHarviaSensor(MyHarviaEntity, SensorEntity):
         # temperature at ['data']['temperature']
         # return self.coordinator.data.get("temperature")
         return self.entity_description.value_fn(self._device)
+
+
+class MyHarviaReadyTimeSensor(MyHarviaEntity, SensorEntity):
+    """MyHarvia estimated ready time Sensor class."""
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return when the sauna is expected to reach its target temperature."""
+        return self.coordinator.ready_time
@@ -1,8 +1,11 @@
 """Platform for myharvia switch integration."""
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any, cast
 
+import voluptuous as vol
+
 from homeassistant.components.switch import (
     SwitchDeviceClass,
     SwitchEntity,
@@ -11,8 +14,17 @@ from homeassistant.components.switch import (
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from .const import DOMAIN
+from homeassistant.util import dt as dt_util
+from .const import (
+    ATTR_READY_AT,
+    ATTR_TARGET_TEMPERATURE,
+    DOMAIN,
+    SERVICE_CANCEL_PREHEAT,
+    SERVICE_SCHEDULE_PREHEAT,
+)
 from .entity import MyHarviaEntity
 
 ENTITY_DESCRIPTIONS: tuple[SwitchEntityDescription, ...] = (
@@ -43,10 +55,25 @@ async def async_setup_entry(
     """Set up the switch platform."""
     async_add_entities(
         MyHarviaSwitch(coordinator=coordinator, entity_description=entity_description)
-        for coordinator in hass.data[DOMAIN][entry.entry_id]
+        for coordinator in hass.data[DOMAIN][entry.entry_id].coordinators
         for entity_description in ENTITY_DESCRIPTIONS
     )
 
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_SCHEDULE_PREHEAT,
+        {
+            vol.Required(ATTR_READY_AT): cv.datetime,
+            vol.Optional(ATTR_TARGET_TEMPERATURE): vol.All(
+                vol.Coerce(float), vol.Range(min=40, max=90)
+            ),
+        },
+        "async_schedule_preheat",
+    )
+    platform.async_register_entity_service(
+        SERVICE_CANCEL_PREHEAT, {}, "async_cancel_preheat"
+    )
+
 
 class MyHarviaSwitch(MyHarviaEntity, SwitchEntity):
     """MyHarvia Switch class."""
@@ -67,3 +94,24 @@ class MyHarviaSwitch(MyHarviaEntity, SwitchEntity):
         data = {self.entity_description.key: 0}
         await self._device.async_request_state_change(data)
         await self.coordinator.async_request_refresh()
+
+    async def async_schedule_preheat(
+        self, ready_at: datetime, target_temperature: float | None = None
+    ) -> None:
+        """Schedule the heater to be ready at the given time."""
+        self._ensure_heater()
+        if dt_util.as_utc(ready_at) <= dt_util.utcnow():
+            raise HomeAssistantError(f"Pre-heat ready time {ready_at} is in the past")
+        self.coordinator.async_schedule_preheat(ready_at, target_temperature)
+
+    async def async_cancel_preheat(self) -> None:
+        """Cancel a scheduled pre-heat."""
+        self._ensure_heater()
+        self.coordinator.async_cancel_preheat()
+
+    def _ensure_heater(self) -> None:
+        """Raise if this switch is not the heater."""
+        if self.entity_description.key != "active":
+            raise HomeAssistantError(
+                f"{self.entity_id} is not a heater, pre-heat is not supported"
+            )